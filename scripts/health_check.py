@@ -17,17 +17,33 @@ Options:
 import argparse
 import asyncio
 import json
+import re
+import socket
+import struct
 import sys
 import time
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field, fields
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Sequence, Tuple
+from urllib.parse import urlsplit
 import logging
 
-import requests
 import aiohttp
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from aiohttp.abc import AbstractResolver
+from aiohttp.resolver import DefaultResolver
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is used instead
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; the default asyncio loop is used instead
+    uvloop = None
+
+# Parse JSON straight from response bytes, preferring orjson's C parser
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -50,6 +66,26 @@ class ServiceCheck:
         if self.metadata is None:
             self.metadata = {}
 
+@dataclass(frozen=True, slots=True)
+class Service:
+    """A service endpoint to health check."""
+    name: str
+    url: str
+    type: str
+    method: str = "GET"  # HTTP method for http probes
+    probe: str = "http"  # 'http' or a key of PROTOCOL_PINGS
+    timeout_ms: Optional[int] = None  # per-service budget, capped by the checker timeout
+
+@dataclass(frozen=True)
+class ProtocolPing:
+    """A native protocol exchange that proves a non-HTTP service is alive."""
+    request: bytes = b""  # sent once connected
+    # Checks the first reply; returns an error message, or None when healthy
+    check: Optional[Callable[[bytes], Optional[str]]] = None
+    read_reply: Optional[Callable[[asyncio.StreamReader], Awaitable[bytes]]] = None
+    # Continues the exchange after a healthy reply so the server sees a clean close
+    finish: Optional[Callable[[asyncio.StreamReader, asyncio.StreamWriter], Awaitable[Optional[str]]]] = None
+
 @dataclass
 class HealthReport:
     """Comprehensive health report for all services."""
@@ -61,100 +97,355 @@ class HealthReport:
     unknown_services: int
     checks: List[ServiceCheck]
     duration: float
+    # Same checks grouped by status; left out of the JSON output
+    by_status: Dict[str, List[ServiceCheck]] = field(default_factory=dict, repr=False)
+
+# Services to check with their endpoints; built once at import time.
+# Endpoints that only need a status line use HEAD so no response body is
+# transferred; probes fall back to GET on 405. Services that do not speak
+# HTTP name a native protocol ping from PROTOCOL_PINGS as their probe.
+# Lightweight liveness checks get a tight budget so a hung service cannot
+# hold the whole run for the full timeout.
+SERVICES: Tuple[Service, ...] = (
+    Service(
+        name="LiteLLM Proxy",
+        url="http://localhost:4000/health/liveliness",
+        type="api",
+    ),
+    Service(
+        name="vLLM Qwen2.5-14B",
+        url="http://localhost:9998/health",
+        type="model",
+    ),
+    Service(
+        name="vLLM Qwen3-30B",
+        url="http://localhost:9999/health",
+        type="model",
+    ),
+    Service(
+        name="Xinference",
+        url="http://localhost:9900/health",
+        type="model",
+    ),
+    Service(
+        name="RAGFlow",
+        url="http://localhost:9380/",
+        type="web",
+        method="HEAD",
+    ),
+    Service(
+        name="Prometheus",
+        url="http://localhost:9090/-/healthy",
+        type="monitoring",
+        method="HEAD",
+        timeout_ms=2000,
+    ),
+    Service(
+        name="PostgreSQL",
+        url="postgresql://localhost:5432",
+        type="database",
+        probe="pg",
+        timeout_ms=2000,
+    ),
+    Service(
+        name="MySQL",
+        url="mysql://localhost:3306",
+        type="database",
+        probe="mysql",
+        timeout_ms=2000,
+    ),
+    Service(
+        name="Redis",
+        url="redis://localhost:6379",
+        type="cache",
+        probe="redis",
+        timeout_ms=2000,
+    ),
+    Service(
+        name="Elasticsearch",
+        url="http://localhost:1200/_cluster/health",
+        type="search",
+    ),
+    Service(
+        name="MinIO",
+        url="http://localhost:9000/minio/health/live",
+        type="storage",
+        method="HEAD",
+        timeout_ms=2000,
+    ),
+)
+
+# PostgreSQL SSLRequest packet: length 8, request code 80877103
+_PG_SSL_REQUEST = struct.pack("!ii", 8, 80877103)
+
+# Redis errors to PING that still mean the server is up and serving
+_REDIS_AUTH_ERRORS = (b"-NOAUTH", b"-WRONGPASS", b"-NOPERM")
+
+# MySQL probe login: a HandshakeResponse41 for _MYSQL_PROBE_USER with an empty
+# mysql_native_password response, 16 MiB max packet and the utf8 charset
+_MYSQL_ACCESS_DENIED = 1045
+_MYSQL_PROBE_USER = b"healthcheck"
+# CLIENT_LONG_PASSWORD | CLIENT_PROTOCOL_41 | CLIENT_SECURE_CONNECTION | CLIENT_PLUGIN_AUTH
+_MYSQL_CLIENT_FLAGS = 0x00000001 | 0x00000200 | 0x00008000 | 0x00080000
+_MYSQL_HANDSHAKE_RESPONSE = (
+    struct.pack("<IIB23x", _MYSQL_CLIENT_FLAGS, 1 << 24, 33)
+    + _MYSQL_PROBE_USER + b"\0"
+    + b"\0"
+    + b"mysql_native_password\0"
+)
+
+def _unexpected_reply(protocol: str, reply: bytes) -> str:
+    """Describe a reply that does not mean the service is healthy."""
+    if not reply:
+        return "Connection closed without reply"
+    first_line = reply.split(b"\r\n", 1)[0][:80].decode(errors="replace")
+    return f"Unexpected {protocol} reply: {first_line!r}"
+
+def _check_pg_reply(reply: bytes) -> Optional[str]:
+    """Check PostgreSQL's answer to an SSLRequest: a single 'S' or 'N' byte."""
+    if reply[:1] in (b"S", b"N"):
+        return None
+    if reply[:1] == b"E":
+        # ErrorResponse: typed NUL-terminated fields; 'M' holds the message
+        for item in reply[5:].split(b"\0"):
+            if item[:1] == b"M":
+                return f"PostgreSQL error: {item[1:].decode(errors='replace')}"
+    return _unexpected_reply("PostgreSQL", reply)
+
+def _mysql_error_message(packet: bytes) -> str:
+    """Format the code and message of a MySQL ERR packet."""
+    code = int.from_bytes(packet[5:7], "little")
+    message = packet[7:]
+    if message[:1] == b"#":
+        message = message[6:]  # skip the SQL state marker
+    return f"MySQL error {code}: {message.decode(errors='replace')}"
+
+def _check_mysql_greeting(reply: bytes) -> Optional[str]:
+    """Check MySQL's first packet: a protocol 10 handshake, or an error."""
+    if len(reply) > 4 and reply[4] == 0x0A:
+        return None
+    if len(reply) > 6 and reply[4] == 0xFF:
+        # ERR packet, e.g. 1040 too many connections or 1129 host blocked
+        return _mysql_error_message(reply)
+    return _unexpected_reply("MySQL", reply)
+
+def _check_mysql_auth_reply(reply: bytes) -> Optional[str]:
+    """Check MySQL's answer to the probe login: OK, or access denied."""
+    if len(reply) > 4 and reply[4] == 0x00:
+        return None
+    if len(reply) > 6 and reply[4] == 0xFF:
+        # 1045 access denied means the server is up and authenticating
+        if int.from_bytes(reply[5:7], "little") == _MYSQL_ACCESS_DENIED:
+            return None
+        return _mysql_error_message(reply)
+    return _unexpected_reply("MySQL", reply)
+
+def _mysql_packet(payload: bytes, sequence: int = 0) -> bytes:
+    """Frame a payload as a MySQL wire packet."""
+    return len(payload).to_bytes(3, "little") + bytes([sequence]) + payload
+
+async def _read_mysql_packet(reader: asyncio.StreamReader) -> bytes:
+    """Read one MySQL packet, header included; partial if the server hangs up."""
+    try:
+        header = await reader.readexactly(4)
+    except asyncio.IncompleteReadError as e:
+        return e.partial
+    try:
+        return header + await reader.readexactly(int.from_bytes(header[:3], "little"))
+    except asyncio.IncompleteReadError as e:
+        return header + e.partial
+
+async def _finish_mysql_handshake(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> Optional[str]:
+    """Log in and quit so MySQL sees a completed handshake.
+
+    MySQL blocks a host after max_connect_errors handshakes in a row are
+    aborted, and hanging up after the greeting is one. Behind a published
+    Docker port every probe arrives from the same bridge gateway address, so
+    periodic greeting-only probes would eventually get it blocked. Failed
+    logins do not count, so the probe signs in as _MYSQL_PROBE_USER with an
+    empty password and accepts "access denied" as a live server.
+    """
+    writer.write(_mysql_packet(_MYSQL_HANDSHAKE_RESPONSE, sequence=1))
+    await writer.drain()
+
+    for _ in range(3):
+        reply = await _read_mysql_packet(reader)
+        if reply[4:5] == b"\xfe":
+            # Auth switch request: answer for the new plugin with an empty password
+            writer.write(_mysql_packet(b"", sequence=reply[3] + 1))
+            await writer.drain()
+            continue
+        if reply[4:6] == b"\x01\x03":
+            continue  # caching_sha2_password fast auth succeeded; OK follows
+        if reply[4:5] == b"\x00":
+            writer.write(_mysql_packet(b"\x01"))  # COM_QUIT
+            await writer.drain()
+        return _check_mysql_auth_reply(reply)
+    return "MySQL login did not complete"
+
+def _check_redis_reply(reply: bytes) -> Optional[str]:
+    """Check Redis' answer to PING: +PONG, or an auth error from a live server."""
+    if reply.startswith(b"+PONG") or reply.startswith(_REDIS_AUTH_ERRORS):
+        return None
+    if reply[:1] == b"-":
+        error = reply[1:].split(b"\r\n", 1)[0]
+        return f"Redis error: {error.decode(errors='replace')}"
+    return _unexpected_reply("Redis", reply)
+
+async def _read_chunk(reader: asyncio.StreamReader) -> bytes:
+    """Read whatever the server sends first, up to 256 bytes."""
+    return await reader.read(256)
+
+# Native protocol pings for services that do not speak HTTP. A probe without a
+# check is a bare TCP connect.
+PROTOCOL_PINGS: Dict[str, ProtocolPing] = {
+    "tcp": ProtocolPing(),
+    "pg": ProtocolPing(request=_PG_SSL_REQUEST, check=_check_pg_reply),
+    "mysql": ProtocolPing(
+        check=_check_mysql_greeting,
+        read_reply=_read_mysql_packet,
+        finish=_finish_mysql_handshake,
+    ),
+    "redis": ProtocolPing(request=b"PING\r\n", check=_check_redis_reply),
+}
+
+# Words in a model server's health body that mean it is serving
+_MODEL_OK_RE = re.compile(rb"\b(?:healthy|ok)\b", re.IGNORECASE)
+
+# Pre-rendered status labels: green, red, yellow, and gray for anything else
+_STATUS_COLOR: Dict[str, str] = {
+    status: f"\033[9{code}m{status.upper()}\033[0m"
+    for status, code in (("healthy", 2), ("unhealthy", 1), ("degraded", 3), ("unknown", 0))
+}
+
+_STATUS_ICON: Dict[str, str] = {
+    "healthy": "✅",
+    "unhealthy": "❌",
+    "degraded": "⚠️",
+}
+
+class _HostCacheResolver(AbstractResolver):
+    """Resolve each hostname once and answer every port from that result."""
+
+    def __init__(self) -> None:
+        self._resolver = DefaultResolver()
+        self._hosts: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
+
+    async def resolve(
+        self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET
+    ) -> List[Dict[str, Any]]:
+        key = (host, family)
+        if key not in self._hosts:
+            self._hosts[key] = await self._resolver.resolve(host, 0, family)
+        return [{**result, "port": port} for result in self._hosts[key]]
+
+    async def close(self) -> None:
+        await self._resolver.close()
 
 class HealthChecker:
     """Main health checker class for all services."""
 
-    def __init__(self, timeout: int = 10, max_retries: int = 3):
+    # Results younger than this (seconds) are reused instead of re-probing
+    CACHE_TTL = 5.0
+    # Bytes of a model health body scanned for _MODEL_OK_RE
+    MODEL_BODY_SCAN_BYTES = 4096
+    # Delay (seconds) added per retry of a failed connection attempt
+    RETRY_BACKOFF = 0.5
+
+    _cache_key: Optional[Tuple[Service, ...]] = None
+    _cache_results: Optional[List[ServiceCheck]] = None
+    _cache_ts: float = 0.0
+
+    def __init__(self, timeout: int = 10, max_retries: int = 0):
         self.timeout = timeout
-        self.max_retries = max_retries
-        self.session = self._create_session()
-
-    def _create_session(self) -> requests.Session:
-        """Create a requests session with retry strategy."""
-        session = requests.Session()
-        retry_strategy = Retry(
-            total=self.max_retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+        self.max_retries = max(max_retries, 0)
+        # Built once and shared by every session and request this checker makes;
+        # connecting to a local port should never need the full budget
+        self._timeout = aiohttp.ClientTimeout(
+            total=self.timeout,
+            connect=min(2, self.timeout),
+            sock_read=self.timeout,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        return session
-
-    def get_services_to_check(self) -> List[Dict[str, str]]:
-        """Get list of services to check with their endpoints."""
-        return [
-            {
-                "name": "LiteLLM Proxy",
-                "url": "http://localhost:4000/health/liveliness",
-                "type": "api"
-            },
-            {
-                "name": "vLLM Qwen2.5-14B",
-                "url": "http://localhost:9998/health",
-                "type": "model"
-            },
-            {
-                "name": "vLLM Qwen3-30B",
-                "url": "http://localhost:9999/health",
-                "type": "model"
-            },
-            {
-                "name": "Xinference",
-                "url": "http://localhost:9900/health",
-                "type": "model"
-            },
-            {
-                "name": "RAGFlow",
-                "url": "http://localhost:9380/",
-                "type": "web"
-            },
-            {
-                "name": "Prometheus",
-                "url": "http://localhost:9090/-/healthy",
-                "type": "monitoring"
-            },
-            {
-                "name": "PostgreSQL",
-                "url": "http://localhost:5432/health",  # Custom health endpoint
-                "type": "database"
-            },
-            {
-                "name": "MySQL",
-                "url": "http://localhost:3306/health",  # Custom health endpoint
-                "type": "database"
-            },
-            {
-                "name": "Redis",
-                "url": "http://localhost:6379/health",  # Custom health endpoint
-                "type": "cache"
-            },
-            {
-                "name": "Elasticsearch",
-                "url": "http://localhost:1200/_cluster/health",
-                "type": "search"
-            },
-            {
-                "name": "MinIO",
-                "url": "http://localhost:9000/minio/health/live",
-                "type": "storage"
-            }
-        ]
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._resolver: Optional[_HostCacheResolver] = None
+        self._cache_lock = asyncio.Lock()
+        # Timestamp shared by every check in the current run; empty outside a run
+        self._run_ts = ""
+
+    async def __aenter__(self) -> "HealthChecker":
+        """Open the shared aiohttp session used by all async checks."""
+        self._resolver = _HostCacheResolver()
+        # Every service is published on IPv4 localhost; skip the ::1 attempts
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=4,
+            keepalive_timeout=60,
+            resolver=self._resolver,
+            use_dns_cache=True,
+            ttl_dns_cache=600,
+            family=socket.AF_INET,
+        )
+        self._session = aiohttp.ClientSession(connector=connector, timeout=self._timeout)
 
-    async def check_service_async(self, service: Dict[str, str]) -> ServiceCheck:
+        # Resolve every hostname once up front; failures surface in the probes
+        hostnames = {urlsplit(service.url).hostname for service in self.get_services_to_check()}
+        await asyncio.gather(
+            *[self._resolver.resolve(hostname) for hostname in hostnames],
+            return_exceptions=True,
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the shared aiohttp session and its connection pool."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._resolver is not None:
+            await self._resolver.close()
+            self._resolver = None
+
+    def get_services_to_check(self) -> Tuple[Service, ...]:
+        """Get services to check with their endpoints and HTTP methods."""
+        return SERVICES
+
+    def _budget(self, service: Service) -> float:
+        """Get the time budget (seconds) for probing a service."""
+        if service.timeout_ms is None:
+            return self.timeout
+        return min(service.timeout_ms / 1000, self.timeout)
+
+    async def check_service_async(self, service: Service) -> ServiceCheck:
         """Asynchronously check a single service."""
-        name = service["name"]
-        url = service["url"]
-        service_type = service["type"]
+        if self._session is not None:
+            return await self._probe(self._session, service)
 
-        start_time = time.time()
+        async with aiohttp.ClientSession(timeout=self._timeout) as session:
+            return await self._probe(session, service)
+
+    async def _probe(self, session: aiohttp.ClientSession, service: Service) -> ServiceCheck:
+        """Probe a single service using the given session."""
+        if service.probe != "http":
+            return await self._probe_protocol(service)
+
+        name = service.name
+        url = service.url
+        service_type = service.type
+        method = service.method
+
+        start_time = time.perf_counter()
 
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-                async with session.get(url) as response:
-                    response_time = time.time() - start_time
+            async with asyncio.timeout(self._budget(service)) as budget:
+                response = await self._request(session, method, url, budget.when())
+                if response.status == 405 and method == "HEAD":
+                    # Endpoint does not allow HEAD; retry as a plain GET
+                    response.release()
+                    response = await self._request(session, "GET", url, budget.when())
+
+                async with response:
+                    response_time = time.perf_counter() - start_time
 
                     if response.status == 200:
                         status = "healthy"
@@ -163,31 +454,38 @@ class HealthChecker:
                         # Additional checks based on service type
                         if service_type == "api" and "health" in url:
                             try:
-                                data = await response.json()
-                                status = data.get("status", "healthy")
-                            except:
+                                data = _json_loads(await response.read())
+                                reported = data.get("status", "healthy")
+                                # Status keys the report partition; ignore non-string values
+                                if isinstance(reported, str):
+                                    status = reported
+                            except Exception:
                                 pass  # Keep as healthy if JSON parsing fails
 
                         elif service_type == "model":
                             # Check if model is actually responding
                             try:
-                                text = await response.text()
-                                if "healthy" not in text.lower() and "ok" not in text.lower():
+                                # Liveness text sits at the top; scan only the first bytes
+                                try:
+                                    body = await response.content.readexactly(self.MODEL_BODY_SCAN_BYTES)
+                                except asyncio.IncompleteReadError as e:
+                                    body = e.partial  # Short body ended before the limit
+                                if not _MODEL_OK_RE.search(body):
                                     status = "degraded"
-                            except:
+                            except Exception:
                                 pass
 
                     else:
                         status = "unhealthy"
                         error_message = f"HTTP {response.status}"
 
-        except asyncio.TimeoutError:
-            response_time = time.time() - start_time
+        except TimeoutError:
+            response_time = time.perf_counter() - start_time
             status = "unhealthy"
             error_message = "Timeout"
 
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = time.perf_counter() - start_time
             status = "unhealthy"
             error_message = str(e)
 
@@ -197,48 +495,70 @@ class HealthChecker:
             status=status,
             response_time=round(response_time * 1000, 2) if response_time else None,  # Convert to ms
             error_message=error_message,
+            timestamp=self._run_ts,
             metadata={"type": service_type}
         )
 
-    def check_service_sync(self, service: Dict[str, str]) -> ServiceCheck:
-        """Synchronously check a single service (fallback method)."""
-        name = service["name"]
-        url = service["url"]
-        service_type = service["type"]
-
-        start_time = time.time()
+    async def _request(
+        self, session: aiohttp.ClientSession, method: str, url: str, deadline: float
+    ) -> aiohttp.ClientResponse:
+        """Send a request, retrying failed connection attempts within the budget.
+
+        A retry is skipped when its backoff would run past ``deadline`` (event
+        loop time), so the last connection error is reported instead of a
+        timeout.
+        """
+        loop = asyncio.get_running_loop()
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await session.request(method, url)
+            except aiohttp.ClientConnectorError as e:
+                last_error = e
+            delay = self.RETRY_BACKOFF * attempt
+            if attempt == self.max_retries or loop.time() + delay >= deadline:
+                break
+            await asyncio.sleep(delay)
+        raise last_error
+
+    async def _probe_protocol(self, service: Service) -> ServiceCheck:
+        """Check a non-HTTP service with a native protocol ping."""
+        name = service.name
+        url = service.url
+        service_type = service.type
+        ping = PROTOCOL_PINGS[service.probe]
+        address = urlsplit(url)
+
+        start_time = time.perf_counter()
 
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response_time = time.time() - start_time
-
-            if response.status_code == 200:
-                status = "healthy"
-                error_message = None
-
-                # Additional checks based on service type
-                if service_type == "api" and "health" in url:
-                    try:
-                        data = response.json()
-                        status = data.get("status", "healthy")
-                    except:
-                        pass
-
-                elif service_type == "model":
-                    if "healthy" not in response.text.lower() and "ok" not in response.text.lower():
-                        status = "degraded"
-
-            else:
-                status = "unhealthy"
-                error_message = f"HTTP {response.status_code}"
-
-        except requests.exceptions.Timeout:
-            response_time = time.time() - start_time
+            async with asyncio.timeout(self._budget(service)):
+                host = address.hostname
+                if self._resolver is not None:
+                    host = (await self._resolver.resolve(host, address.port))[0]["host"]
+                reader, writer = await asyncio.open_connection(host, address.port)
+                try:
+                    if ping.request:
+                        writer.write(ping.request)
+                        await writer.drain()
+                    error_message = None
+                    if ping.check is not None:
+                        read_reply = ping.read_reply or _read_chunk
+                        error_message = ping.check(await read_reply(reader))
+                    if error_message is None and ping.finish is not None:
+                        error_message = await ping.finish(reader, writer)
+                finally:
+                    writer.close()
+            response_time = time.perf_counter() - start_time
+            status = "unhealthy" if error_message else "healthy"
+
+        except TimeoutError:
+            response_time = time.perf_counter() - start_time
             status = "unhealthy"
             error_message = "Timeout"
 
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = time.perf_counter() - start_time
             status = "unhealthy"
             error_message = str(e)
 
@@ -246,30 +566,81 @@ class HealthChecker:
             name=name,
             url=url,
             status=status,
-            response_time=round(response_time * 1000, 2) if response_time else None,
+            response_time=round(response_time * 1000, 2) if response_time else None,  # Convert to ms
             error_message=error_message,
+            timestamp=self._run_ts,
             metadata={"type": service_type}
         )
 
-    async def run_health_checks_async(self, services: List[Dict[str, str]]) -> List[ServiceCheck]:
-        """Run health checks asynchronously for all services."""
-        tasks = [self.check_service_async(service) for service in services]
-        return await asyncio.gather(*tasks)
+    async def run_health_checks_async(
+        self, services: Sequence[Service], use_cache: bool = True
+    ) -> List[ServiceCheck]:
+        """Run health checks asynchronously for all services.
+
+        Results are cached for ``CACHE_TTL`` seconds per service list, and
+        concurrent callers wait on a lock so they share a single execution.
+        """
+        cache_key = tuple(services)
+
+        async with self._cache_lock:
+            if (
+                use_cache
+                and self._cache_results is not None
+                and self._cache_key == cache_key
+                and time.monotonic() - self._cache_ts < self.CACHE_TTL
+            ):
+                return self._cache_results
+
+            self._run_ts = datetime.now().isoformat()
+            try:
+                if self._session is not None:
+                    results = await self._gather_probes(self._session, services)
+                else:
+                    async with aiohttp.ClientSession(timeout=self._timeout) as session:
+                        results = await self._gather_probes(session, services)
+            finally:
+                self._run_ts = ""
+
+            self._cache_key = cache_key
+            self._cache_results = results
+            self._cache_ts = time.monotonic()
+            return results
+
+    async def _gather_probes(
+        self, session: aiohttp.ClientSession, services: Sequence[Service]
+    ) -> List[ServiceCheck]:
+        """Probe all services concurrently over one session, keeping partial results."""
+        outcomes = await asyncio.gather(
+            *[self._probe(session, service) for service in services],
+            return_exceptions=True,
+        )
 
-    def run_health_checks_sync(self, services: List[Dict[str, str]]) -> List[ServiceCheck]:
-        """Run health checks synchronously for all services (fallback)."""
         results = []
-        for service in services:
-            result = self.check_service_sync(service)
-            results.append(result)
-            logger.info(f"Checked {result.name}: {result.status}")
+        for service, outcome in zip(services, outcomes):
+            if isinstance(outcome, BaseException):
+                outcome = ServiceCheck(
+                    name=service.name,
+                    url=service.url,
+                    status="unhealthy",
+                    error_message=str(outcome),
+                    timestamp=self._run_ts,
+                    metadata={"type": service.type}
+                )
+            results.append(outcome)
         return results
 
     def generate_report(self, checks: List[ServiceCheck], duration: float) -> HealthReport:
         """Generate a comprehensive health report."""
-        healthy_count = sum(1 for check in checks if check.status == "healthy")
-        unhealthy_count = sum(1 for check in checks if check.status == "unhealthy")
-        unknown_count = sum(1 for check in checks if check.status == "unknown")
+        # Partition the checks by status in a single pass
+        by_status: Dict[str, List[ServiceCheck]] = {
+            "healthy": [], "unhealthy": [], "degraded": [], "unknown": []
+        }
+        for check in checks:
+            by_status.setdefault(check.status, []).append(check)
+
+        healthy_count = len(by_status["healthy"])
+        unhealthy_count = len(by_status["unhealthy"])
+        unknown_count = len(by_status["unknown"])
 
         # Determine overall status
         if unhealthy_count > 0:
@@ -287,71 +658,82 @@ class HealthChecker:
             unhealthy_services=unhealthy_count,
             unknown_services=unknown_count,
             checks=checks,
-            duration=round(duration, 2)
+            duration=round(duration, 2),
+            by_status=by_status
         )
 
     def print_report(self, report: HealthReport, verbose: bool = False, json_output: bool = False):
         """Print the health report in a readable format."""
         if json_output:
-            print(json.dumps(asdict(report), indent=2, default=str))
+            # Top-level report fields only; by_status repeats the checks
+            data = {f.name: getattr(report, f.name) for f in fields(report) if f.name != "by_status"}
+            if orjson is not None:
+                # orjson serializes the nested dataclasses itself; no asdict() deep copy
+                output = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+                buffer = getattr(sys.stdout, "buffer", None)
+                if buffer is not None:
+                    sys.stdout.flush()
+                    buffer.write(output)
+                    buffer.flush()
+                else:
+                    # Text-only stdout, e.g. redirect_stdout(io.StringIO())
+                    sys.stdout.write(output.decode())
+            else:
+                data["checks"] = [asdict(check) for check in report.checks]
+                print(json.dumps(data, indent=2, default=str))
             return
 
-        print(f"\n{'='*60}")
-        print("🏥 MULTI-MODEL LLM DEPLOYMENT HEALTH REPORT")
-        print(f"{'='*60}")
-        print(f"📅 Timestamp: {report.timestamp}")
-        print(f"⏱️  Duration: {report.duration}s")
-        print(f"📊 Overall Status: {self._colorize_status(report.overall_status)}")
-        print(f"🔢 Total Services: {report.total_services}")
-        print(f"✅ Healthy: {report.healthy_services}")
-        print(f"❌ Unhealthy: {report.unhealthy_services}")
-        print(f"❓ Unknown: {report.unknown_services}")
-        print(f"{'='*60}")
+        # Build the whole report first so it reaches stdout in a single write
+        separator = "=" * 60
+        lines = [
+            "",
+            separator,
+            "🏥 MULTI-MODEL LLM DEPLOYMENT HEALTH REPORT",
+            separator,
+            f"📅 Timestamp: {report.timestamp}",
+            f"⏱️  Duration: {report.duration}s",
+            f"📊 Overall Status: {self._colorize_status(report.overall_status)}",
+            f"🔢 Total Services: {report.total_services}",
+            f"✅ Healthy: {report.healthy_services}",
+            f"❌ Unhealthy: {report.unhealthy_services}",
+            f"❓ Unknown: {report.unknown_services}",
+            separator,
+        ]
 
         if verbose:
-            print("\n📋 DETAILED SERVICE STATUS:")
-            print("-" * 80)
+            lines.append("\n📋 DETAILED SERVICE STATUS:")
+            lines.append("-" * 80)
 
             for check in report.checks:
                 status_icon = self._get_status_icon(check.status)
                 response_time = f"{check.response_time}ms" if check.response_time else "N/A"
 
-                print(f"{status_icon} {check.name:<20} | {self._colorize_status(check.status):<10} | {response_time:<8} | {check.url}")
+                lines.append(f"{status_icon} {check.name:<20} | {self._colorize_status(check.status):<10} | {response_time:<8} | {check.url}")
 
-                if check.error_message and verbose:
-                    print(f"{'':<24} └─ Error: {check.error_message}")
+                if check.error_message:
+                    lines.append(f"{'':<24} └─ Error: {check.error_message}")
 
-        print(f"\n{'='*60}")
+        lines.append(f"\n{separator}")
 
         # Summary message
         if report.overall_status == "healthy":
-            print("🎉 All systems operational!")
+            lines.append("🎉 All systems operational!")
         elif report.overall_status == "degraded":
-            print("⚠️  Some services have unknown status. Manual check recommended.")
+            lines.append("⚠️  Some services have unknown status. Manual check recommended.")
         else:
-            print("🚨 Critical services are down. Immediate attention required!")
+            lines.append("🚨 Critical services are down. Immediate attention required!")
+
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
 
     def _colorize_status(self, status: str) -> str:
         """Add color coding to status text."""
-        if status == "healthy":
-            return f"\033[92m{status.upper()}\033[0m"  # Green
-        elif status == "unhealthy":
-            return f"\033[91m{status.upper()}\033[0m"  # Red
-        elif status == "degraded":
-            return f"\033[93m{status.upper()}\033[0m"  # Yellow
-        else:
-            return f"\033[90m{status.upper()}\033[0m"  # Gray
+        return _STATUS_COLOR.get(status) or f"\033[90m{status.upper()}\033[0m"
 
     def _get_status_icon(self, status: str) -> str:
         """Get appropriate icon for status."""
-        if status == "healthy":
-            return "✅"
-        elif status == "unhealthy":
-            return "❌"
-        elif status == "degraded":
-            return "⚠️"
-        else:
-            return "❓"
+        return _STATUS_ICON.get(status, "❓")
 
 async def main():
     """Main function to run health checks."""
@@ -360,42 +742,34 @@ async def main():
     parser.add_argument("-j", "--json", action="store_true", help="Output results in JSON format")
     parser.add_argument("-a", "--alert", action="store_true", help="Send alerts for failed services")
     parser.add_argument("-t", "--timeout", type=int, default=10, help="Timeout for each service check (seconds)")
-    parser.add_argument("-r", "--retries", type=int, default=3, help="Max retries for each service check")
+    parser.add_argument("-r", "--retries", type=int, default=0, help="Max connection retries for each service check")
 
     args = parser.parse_args()
 
-    # Initialize health checker
-    checker = HealthChecker(timeout=args.timeout, max_retries=args.retries)
+    # Initialize health checker; the context manager owns the shared HTTP session
+    async with HealthChecker(timeout=args.timeout, max_retries=args.retries) as checker:
+        # Get services to check
+        services = checker.get_services_to_check()
 
-    # Get services to check
-    services = checker.get_services_to_check()
+        print("🔍 Starting health checks..." if not args.json else "", end="")
+        if not args.json:
+            print(f" Checking {len(services)} services...")
 
-    print("🔍 Starting health checks..." if not args.json else "", end="")
-    if not args.json:
-        print(f" Checking {len(services)} services...")
+        start_time = time.perf_counter()
 
-    start_time = time.time()
-
-    try:
-        # Try async first, fallback to sync
         checks = await checker.run_health_checks_async(services)
-    except ImportError:
-        # Fallback to synchronous checks if aiohttp is not available
-        logger.warning("aiohttp not available, using synchronous checks")
-        checks = checker.run_health_checks_sync(services)
 
-    duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
 
-    # Generate and print report
-    report = checker.generate_report(checks, duration)
-    checker.print_report(report, verbose=args.verbose, json_output=args.json)
+        # Generate and print report
+        report = checker.generate_report(checks, duration)
+        checker.print_report(report, verbose=args.verbose, json_output=args.json)
 
     # Handle alerts
     if args.alert and report.unhealthy_services > 0:
         print("\n🚨 ALERT: Some services are unhealthy!")        # Here you could integrate with alerting systems like Slack, email, etc.
         # For now, just print the information
-        unhealthy_services = [check for check in checks if check.status == "unhealthy"]
-        for service in unhealthy_services:
+        for service in report.by_status["unhealthy"]:
             print(f"  - {service.name}: {service.error_message}")
 
     # Exit with appropriate code
@@ -407,8 +781,10 @@ async def main():
         sys.exit(0)
 
 if __name__ == "__main__":
+    # Run on uvloop when it is installed (it does not support Windows)
+    loop_factory = uvloop.new_event_loop if uvloop is not None and sys.platform != "win32" else None
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=loop_factory)
     except KeyboardInterrupt:
         print("\n🛑 Health check interrupted by user")
         sys.exit(130)
@@ -0,0 +1,252 @@
+"""Tests for the native protocol ping checks in scripts/health_check.py."""
+
+import asyncio
+import contextlib
+import io
+import json
+import socket
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import health_check  # noqa: E402
+
+
+def mysql_packet(payload: bytes, sequence: int = 0) -> bytes:
+    """Frame a payload as a MySQL wire packet."""
+    return struct.pack("<I", len(payload))[:3] + bytes([sequence]) + payload
+
+
+def mysql_error(code: int, message: bytes) -> bytes:
+    """Build a MySQL ERR packet as sent before the handshake completes."""
+    return mysql_packet(b"\xff" + struct.pack("<H", code) + message)
+
+
+def pg_error(message: bytes) -> bytes:
+    """Build a PostgreSQL ErrorResponse message."""
+    body = b"SFATAL\0C53300\0M" + message + b"\0\0"
+    return b"E" + struct.pack("!i", len(body) + 4) + body
+
+
+@pytest.mark.parametrize(
+    "probe, reply, healthy, error_part",
+    [
+        # PostgreSQL: SSL supported, SSL not supported, error, empty
+        ("pg", b"S", True, None),
+        ("pg", b"N", True, None),
+        ("pg", pg_error(b"sorry, too many clients already"), False, "too many clients"),
+        ("pg", b"HTTP/1.1 400 Bad Request\r\n", False, "Unexpected PostgreSQL reply"),
+        ("pg", b"", False, "Connection closed"),
+        # MySQL: handshake greeting, refusal errors, empty
+        ("mysql", mysql_packet(b"\x0a8.0.36\0" + b"\0" * 40), True, None),
+        ("mysql", mysql_error(1040, b"Too many connections"), False, "MySQL error 1040: Too many connections"),
+        ("mysql", mysql_error(1129, b"Host '172.17.0.1' is blocked"), False, "MySQL error 1129"),
+        ("mysql", mysql_packet(b"\x09old"), False, "Unexpected MySQL reply"),
+        ("mysql", b"", False, "Connection closed"),
+        # Redis: pong, auth required, loading/other errors, empty
+        ("redis", b"+PONG\r\n", True, None),
+        ("redis", b"-NOAUTH Authentication required.\r\n", True, None),
+        ("redis", b"-WRONGPASS invalid username-password pair\r\n", True, None),
+        ("redis", b"-NOPERM this user has no permissions to run the 'ping' command\r\n", True, None),
+        ("redis", b"-LOADING Redis is loading the dataset in memory\r\n", False, "Redis error: LOADING"),
+        ("redis", b"-MISCONF Errors writing to the AOF file\r\n", False, "Redis error: MISCONF"),
+        ("redis", b"+OK\r\n", False, "Unexpected Redis reply"),
+        ("redis", b"", False, "Connection closed"),
+    ],
+)
+def test_protocol_ping_checks(probe, reply, healthy, error_part):
+    error = health_check.PROTOCOL_PINGS[probe].check(reply)
+
+    if healthy:
+        assert error is None
+    else:
+        assert error is not None
+        assert error_part in error
+
+
+@pytest.mark.parametrize(
+    "reply, healthy, error_part",
+    [
+        (mysql_packet(b"\x00\x00\x00\x02\x00\x00\x00", 2), True, None),
+        (mysql_error(1045, b"#28000Access denied for user 'healthcheck'"), True, None),
+        (mysql_error(3159, b"#HY000Connections using insecure transport are prohibited"), False, "MySQL error 3159: Connections"),
+        (mysql_packet(b"\x01\x04", 2), False, "Unexpected MySQL reply"),
+        (b"", False, "Connection closed"),
+    ],
+)
+def test_mysql_auth_reply_check(reply, healthy, error_part):
+    error = health_check._check_mysql_auth_reply(reply)
+
+    if healthy:
+        assert error is None
+    else:
+        assert error_part in error
+
+
+def test_tcp_probe_has_no_reply_check():
+    ping = health_check.PROTOCOL_PINGS["tcp"]
+
+    assert ping.request == b""
+    assert ping.check is None
+    assert ping.finish is None
+
+
+def test_mysql_probe_completes_login_before_closing():
+    received = []
+
+    async def server(reader, writer):
+        writer.write(mysql_packet(b"\x0a8.0.36\0" + b"\0" * 40))
+        received.append(await health_check._read_mysql_packet(reader))
+        writer.write(mysql_packet(b"\xfecaching_sha2_password\0" + b"s" * 20 + b"\0", 2))
+        received.append(await health_check._read_mysql_packet(reader))
+        writer.write(mysql_error(1045, b"#28000Access denied for user 'healthcheck'"))
+        await writer.drain()
+        writer.close()
+
+    async def probe():
+        listener = await asyncio.start_server(server, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        service = health_check.Service(
+            name="MySQL", url=f"mysql://127.0.0.1:{port}", type="database", probe="mysql"
+        )
+        async with listener:
+            return await health_check.HealthChecker(timeout=2).check_service_async(service)
+
+    check = asyncio.run(probe())
+
+    assert check.status == "healthy", check.error_message
+    handshake_response, switch_response = received
+    assert handshake_response[3] == 1
+    assert b"\0healthcheck\0" in handshake_response
+    assert switch_response == mysql_packet(b"", 3)
+
+
+def report_with_checks():
+    checker = health_check.HealthChecker()
+    checks = [
+        health_check.ServiceCheck(name="Redis", url="redis://localhost:6379", status="healthy"),
+        health_check.ServiceCheck(
+            name="MySQL", url="mysql://localhost:3306", status="unhealthy", error_message="Timeout"
+        ),
+    ]
+    return checker, checker.generate_report(checks, duration=0.5)
+
+
+def test_json_report_writes_to_text_only_stdout():
+    checker, report = report_with_checks()
+    output = io.StringIO()
+
+    with contextlib.redirect_stdout(output):
+        checker.print_report(report, json_output=True)
+
+    data = json.loads(output.getvalue())
+    assert [check["name"] for check in data["checks"]] == ["Redis", "MySQL"]
+    assert "by_status" not in data
+
+
+def unused_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.parametrize("max_retries", [-1, 0, 5])
+def test_refused_http_port_reports_connect_error(max_retries):
+    service = health_check.Service(
+        name="Prometheus",
+        url=f"http://127.0.0.1:{unused_port()}/-/healthy",
+        type="monitoring",
+        timeout_ms=600,
+    )
+
+    async def probe():
+        checker = health_check.HealthChecker(timeout=2, max_retries=max_retries)
+        return await checker.check_service_async(service)
+
+    check = asyncio.run(probe())
+
+    assert check.status == "unhealthy"
+    assert "Cannot connect" in check.error_message
+    assert check.response_time < 600
+
+
+@pytest.mark.parametrize(
+    "chunks, status",
+    [
+        ([b"x" * 10, b" healthy"], "healthy"),
+        ([b"x" * 10, b" ok", b"\n"], "healthy"),
+        ([b"x" * 10, b" starting"], "degraded"),
+        ([b"x" * 4096, b" healthy"], "degraded"),
+    ],
+)
+def test_model_probe_scans_body_across_chunks(chunks, status):
+    async def server(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\nConnection: close\r\n\r\n")
+        for chunk in chunks:
+            writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            await writer.drain()
+            await asyncio.sleep(0.02)
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+        writer.close()
+
+    async def probe():
+        listener = await asyncio.start_server(server, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        service = health_check.Service(
+            name="vLLM", url=f"http://127.0.0.1:{port}/health", type="model"
+        )
+        async with listener:
+            return await health_check.HealthChecker(timeout=2).check_service_async(service)
+
+    check = asyncio.run(probe())
+
+    assert check.status == status, check.error_message
+
+
+@pytest.mark.parametrize(
+    "body, status",
+    [
+        (b'{"status": "healthy"}', "healthy"),
+        (b'{"status": "degraded"}', "degraded"),
+        (b'{"status": ["a"]}', "healthy"),
+        (b'{"status": null}', "healthy"),
+        (b'{"status": {"db": "ok"}}', "healthy"),
+        (b'["healthy"]', "healthy"),
+    ],
+)
+def test_api_probe_only_reports_string_status(body, status):
+    async def server(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+            b"Content-Length: %d\r\nConnection: close\r\n\r\n%s" % (len(body), body)
+        )
+        await writer.drain()
+        writer.close()
+
+    async def probe():
+        listener = await asyncio.start_server(server, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        service = health_check.Service(
+            name="LiteLLM", url=f"http://127.0.0.1:{port}/health", type="api"
+        )
+        async with listener:
+            checker = health_check.HealthChecker(timeout=2)
+            check = await checker.check_service_async(service)
+        return checker, check
+
+    checker, check = asyncio.run(probe())
+    report = checker.generate_report([check], duration=0.1)
+
+    assert check.status == status
+    assert report.by_status[status] == [check]
+    with contextlib.redirect_stdout(io.StringIO()):
+        checker.print_report(report, verbose=True)